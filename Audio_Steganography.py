@@ -6,14 +6,14 @@ import sounddevice as sd
 import threading
 import os
 import struct
+import binascii
 import math
 import ctypes
 import time
-import scipy.ndimage
+import functools
 
-# Matplotlib integration for Tkinter
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+# NOTE: Matplotlib is imported lazily in create_plot_canvas() so the window
+# can appear before its (slow) import and TkAgg backend setup have run.
 
 # Attempt to enable High DPI awareness for Windows
 try:
@@ -73,16 +73,25 @@ class AudioStegoApp:
         # State variables
         self.carrier_path = None
         self.payload_path = None
+        self.payload_size = 0 # Bytes, read once when the payload is selected
         self.decode_audio_path = None
         self.sample_rate = 0
         self.audio_data = None # Numpy array (Original)
         self.processed_audio = None # Numpy array (Stego)
+        self._display_original = None # Plot envelope of audio_data, see plot_envelope()
+        self._display_stego = None # Plot envelope of processed_audio
+        self._display_residual = None # Plot envelope of processed_audio - audio_data
         self.decode_audio_data = None # Audio loaded for decoding
         self.is_playing = False
         self.play_thread = None
-        self.decode_thread = None
+        self._out_stream = None # Output stream shared by all playback, see get_output_stream()
         self.exiting = False
         self.comparison_file_path = None  # Optional file for BER comparison
+        self._dirty = set() # Pending UI refreshes ('capacity', 'plots'), see mark_dirty()
+        self._flush_scheduled = False
+        self._capacity_after_id = None # Pending debounced capacity refresh
+        self._busy_jobs = 0 # Encodes running in worker threads, see set_busy()
+        self._pn_cache = {} # DSSS PN sequences keyed by frame_size, see pn_sequence()
         
         # Echo Hiding Parameters
         self.echo_chunk_size = tk.IntVar(value=2048)
@@ -111,6 +120,12 @@ class AudioStegoApp:
             b'MZ': ('.exe', 'Windows Executable'),
             b'\x7fELF': ('.elf', 'Linux Executable'),
         }
+        # All prefixes as one tuple so bytes.startswith() can test them in C
+        self._magic_prefixes = tuple(self.MAGIC_BYTES)
+        # Same table grouped by prefix length: {length: {prefix: (ext, desc)}}
+        self._magic_by_len = {}
+        for magic, info in self.MAGIC_BYTES.items():
+            self._magic_by_len.setdefault(len(magic), {})[magic] = info
         
         # Handle window closing properly to prevent lingering threads/callbacks
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -201,18 +216,17 @@ class AudioStegoApp:
         self.exiting = True
         self.stop_audio()
 
-        # Try to join playback threads briefly so resources close cleanly
+        # Try to join the playback thread briefly so resources close cleanly
         try:
             if self.play_thread and self.play_thread.is_alive():
-                sd.stop()
                 self.play_thread.join(timeout=0.5)
         except Exception:
             pass
 
+        # The output stream is only closed here, playback keeps it open
         try:
-            if self.decode_thread and self.decode_thread.is_alive():
-                sd.stop()
-                self.decode_thread.join(timeout=0.5)
+            if self._out_stream is not None:
+                self._out_stream.close()
         except Exception:
             pass
 
@@ -300,8 +314,8 @@ class AudioStegoApp:
         self.spin_alpha.grid(row=3, column=1, sticky="w", padx=5)
         ttk.Label(self.advanced_content, text="Echo strength (0.1-1.0). Higher = more reliable but audible.", font=("Segoe UI", 8), foreground="#666").grid(row=3, column=2, sticky="w", padx=5)
         
-        # Bind chunk size changes to update capacity
-        self.echo_chunk_size.trace_add("write", lambda *args: self.update_capacity_check())
+        # Bind chunk size changes to update capacity (debounced, fires on every keystroke)
+        self.echo_chunk_size.trace_add("write", lambda *args: self.debounce_capacity_check())
         
         # Reset button
         ttk.Button(self.advanced_content, text="Reset to Defaults", command=self.reset_echo_defaults).grid(row=4, column=0, columnspan=2, sticky="w", pady=(10, 0))
@@ -320,32 +334,80 @@ class AudioStegoApp:
         
         self.btn_bake = ttk.Button(ctrl_frame, text="Generate & Save Output File", command=self.save_stego_file, state="disabled")
         self.btn_bake.pack(fill="x", pady=(10, 0))
+        
+        # Shown below the buttons only while an encode runs in the background
+        self.progress = ttk.Progressbar(ctrl_frame, mode="indeterminate")
 
         # 4. Visualization
-        plot_frame = ttk.LabelFrame(self.tab_encode, text=" Visualization ", padding=5)
-        plot_frame.grid(row=3, column=0, sticky="nsew", padx=10, pady=10)
+        self.plot_frame = ttk.LabelFrame(self.tab_encode, text=" Visualization ", padding=5)
+        self.plot_frame.grid(row=3, column=0, sticky="nsew", padx=10, pady=10)
+        
+        # The figure is built once the window is idle (see create_plot_canvas)
+        self.fig = None
+        self.canvas = None
+        self.root.after_idle(self.create_plot_canvas)
+
+    def create_plot_canvas(self):
+        """Import Matplotlib and build the visualization figure on first use."""
+        # Import here to avoid slow startup (lazy import)
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
         
         self.fig, (self.ax1, self.ax2) = plt.subplots(2, 1, figsize=(5, 5), dpi=100)
         self.fig.patch.set_facecolor(self.bg_color)
         self.fig.tight_layout(pad=3.0)
         
-        self.canvas = FigureCanvasTkAgg(self.fig, master=plot_frame)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_frame)
         self.canvas.draw()
         
         # Pack canvas first taking all available space
         self.canvas.get_tk_widget().pack(fill="both", expand=True, side="top")
 
         # Add Interactive Toolbar (packs itself to bottom by default)
-        self.toolbar = NavigationToolbar2Tk(self.canvas, plot_frame)
+        self.toolbar = NavigationToolbar2Tk(self.canvas, self.plot_frame)
         self.toolbar.update()
 
         self.reset_plots()
+        if self.audio_data is not None:
+            self.update_plots()
         
     def on_algo_change(self, event):
-        self.update_capacity_check()
-        self.update_algo_description()
-
+        self.mark_dirty('capacity')
 
+    def mark_dirty(self, *keys):
+        """
+        Queue UI refreshes and apply them together once Tk is idle.
+        
+        Several handlers can request the same refresh in one event (e.g. Reset to
+        Defaults writes the chunk size and then asks for a capacity update). Each
+        refresh runs only once per idle pass no matter how often it was requested.
+        
+        Args:
+            *keys: 'capacity' (status label + description) and/or 'plots'
+        """
+        self._dirty.update(keys)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after_idle(self.flush_ui)
+
+    def debounce_capacity_check(self, delay_ms=100):
+        """Refresh the capacity once no new request has come in for delay_ms."""
+        if self._capacity_after_id is not None:
+            self.root.after_cancel(self._capacity_after_id)
+        self._capacity_after_id = self.root.after(delay_ms, self._capacity_settled)
+
+    def _capacity_settled(self):
+        self._capacity_after_id = None
+        self.mark_dirty('capacity')
+
+    def flush_ui(self):
+        """Run every refresh queued by mark_dirty() since the last flush."""
+        dirty, self._dirty = self._dirty, set()
+        self._flush_scheduled = False
+        if 'capacity' in dirty:
+            self.update_capacity_check()
+        if 'plots' in dirty:
+            self.update_plots()
     
     def toggle_advanced_settings(self):
         """Toggle visibility of the advanced settings panel."""
@@ -364,9 +426,10 @@ class AudioStegoApp:
         self.echo_delay_0.set(50)
         self.echo_delay_1.set(200)
         self.echo_alpha.set(0.5)
-        self.update_capacity_check()
+        self.mark_dirty('capacity')
 
     def reset_plots(self):
+        if self.canvas is None: return
         self.ax1.clear()
         self.ax2.clear()
         self.ax1.set_title("Waveform Comparison", fontsize=9)
@@ -374,60 +437,101 @@ class AudioStegoApp:
         self.ax1.set_ylabel("Amplitude", fontsize=8)
         self.ax1.set_facecolor("#f9f9f9")
         self.ax1.tick_params(labelsize=8)
-        self.ax1.text(0.5, 0.5, "Load Audio to Visualise", ha='center', fontsize=8)
+        self.ax1_hint = self.ax1.text(0.5, 0.5, "Load Audio to Visualise", ha='center', fontsize=8, transform=self.ax1.transAxes)
         
         self.ax2.set_title("Difference (Stego - Original)", fontsize=9)
         self.ax2.set_facecolor("#f9f9f9")
         self.ax2.tick_params(labelsize=8)
         self.ax2.set_ylabel("Amplitude", fontsize=8)
+        self.ax2_hint = self.ax2.text(0.5, 0.5, "Generate Preview to see noise", ha='center', fontsize=8, transform=self.ax2.transAxes, visible=False)
+        
+        # The lines are created once here; update_plots() only swaps their data
+        # (set_data) instead of clearing the axes and building new artists.
+        # Use thinner line for performance
+        self.line_orig, = self.ax1.plot([], [], label="Original", color="blue", alpha=0.6, linewidth=0.5)
+        self.line_stego, = self.ax1.plot([], [], label="Stego", color="orange", linestyle="--", alpha=0.8, linewidth=0.5)
+        self.line_diff, = self.ax2.plot([], [], color="red", linewidth=0.5)
         
         self.canvas.draw()
 
+    def plot_envelope(self, samples, step):
+        """
+        Reduce samples to the minimum and maximum of every block of step samples.
+        
+        Plain decimation (samples[::step]) drops the peaks between the samples
+        it keeps; the envelope keeps them, so the plot shows the true waveform
+        outline. A trailing partial block is left out.
+        
+        Returns:
+            np.ndarray: min/max pairs interleaved, two points per block
+        """
+        blocks = samples[:len(samples) // step * step].reshape(-1, step)
+        envelope = np.empty((len(blocks), 2), dtype=blocks.dtype)
+        np.min(blocks, axis=1, out=envelope[:, 0])
+        np.max(blocks, axis=1, out=envelope[:, 1])
+        return envelope.ravel()
+
     def update_plots(self):
-        if self.audio_data is None: return
+        if self.audio_data is None or self.canvas is None: return
 
         # Performance Fix: Downsample data for plotting
-        # Plotting millions of points causes lag. We limit to ~10k points.
+        # Plotting millions of points causes lag. We limit to ~10k points:
+        # the min and max of ~5k blocks. The envelopes are cached until the
+        # audio changes, so redraws do not scan the samples again.
         total_points = len(self.audio_data)
-        step = max(1, total_points // 10000)
-        
-        # Downsampled data
-        plot_data = self.audio_data[::step]
+        step = max(1, total_points // 5000)
+        if self._display_original is None:
+            self._display_original = self.plot_envelope(self.audio_data, step)
+        plot_data = self._display_original
         
-        # Create Time Axis (Seconds)
-        duration = total_points / self.sample_rate
-        time_axis = np.linspace(0, duration, len(plot_data))
+        # Create Time Axis (Seconds): the start of each block, once for its
+        # minimum and once for its maximum
+        time_axis = np.repeat(np.arange(len(plot_data) // 2) * (step / self.sample_rate), 2)
         
-        self.ax1.clear()
-        self.ax1.set_title("Waveform Comparison", fontsize=9)
-        self.ax1.set_xlabel("Time (seconds)", fontsize=8)
-        self.ax1.set_ylabel("Amplitude", fontsize=8)
-        # Use thinner line for performance
-        self.ax1.plot(time_axis, plot_data, label="Original", color="blue", alpha=0.6, linewidth=0.5)
+        self.ax1_hint.set_visible(False)
+        self.line_orig.set_data(time_axis, plot_data)
         
         if self.processed_audio is not None:
             # Downsample stego audio too
-            stego_plot = self.processed_audio[::step]
-            self.ax1.plot(time_axis, stego_plot, label="Stego", color="orange", linestyle="--", alpha=0.8, linewidth=0.5)
+            if self._display_stego is None:
+                self._display_stego = self.plot_envelope(self.processed_audio, step)
+                # The residual must stay at full int16 resolution (LSB changes
+                # are only +/-1), so its envelope is taken of the difference of
+                # all samples (int32 so large echo changes cannot wrap around)
+                residual = np.subtract(self.processed_audio, self.audio_data, dtype=np.int32)
+                self._display_residual = self.plot_envelope(residual, step)
+            stego_plot = self._display_stego
+            self.line_stego.set_data(time_axis, stego_plot)
+            self.line_stego.set_visible(True)
             
-            diff = self.processed_audio - self.audio_data
-            diff_plot = diff[::step]
+            diff_plot = self._display_residual
             
-            self.ax2.clear()
             self.ax2.set_title("Residual Noise (Added Signal)", fontsize=9)
             self.ax2.set_xlabel("Time (seconds)", fontsize=8)
-            self.ax2.set_ylabel("Amplitude", fontsize=8) 
-            self.ax2.plot(time_axis, diff_plot, color="red", linewidth=0.5)
+            self.ax2_hint.set_visible(False)
+            self.line_diff.set_data(time_axis, diff_plot)
+            self.line_diff.set_visible(True)
+            self.ax2.relim()
+            self.ax2.autoscale_view(scaley=False)
             mx = np.max(np.abs(diff_plot))
             if mx == 0: mx = 1
             self.ax2.set_ylim(-mx*1.2, mx*1.2)
         else:
-            self.ax2.clear()
+            self.line_stego.set_data([], [])
+            self.line_stego.set_visible(False)
             self.ax2.set_title("Residual Noise (Added Signal)", fontsize=9)
-            self.ax2.text(0.5, 0.5, "Generate Preview to see noise", ha='center', fontsize=8)
+            self.line_diff.set_data([], [])
+            self.line_diff.set_visible(False)
+            self.ax2_hint.set_visible(True)
         
-        self.ax1.legend(fontsize=8, loc='upper right')
-        self.canvas.draw()
+        # New data does not rescale the axes by itself
+        self.ax1.relim()
+        self.ax1.autoscale_view()
+        
+        visible = [line for line in (self.line_orig, self.line_stego) if line.get_visible()]
+        self.ax1.legend(handles=visible, fontsize=8, loc='upper right')
+        # Redraw once Tk is idle (coalesces with other pending draws)
+        self.canvas.draw_idle()
 
     def setup_decode_tab(self):
         self.tab_decode.columnconfigure(0, weight=1)
@@ -485,20 +589,43 @@ class AudioStegoApp:
         if path:
             self.carrier_path = path
             try:
-                self.sample_rate, self.audio_data = wav.read(path)
+                # Memory-map the PCM data instead of reading it into RAM: the OS
+                # pages samples in on demand, so large carriers load instantly.
+                # The map is copy-on-write, so nothing ever writes back to the file.
+                try:
+                    self.sample_rate, self.audio_data = wav.read(path, mmap=True)
+                except ValueError:
+                    # Formats SciPy cannot map (e.g. 24-bit PCM) need a full read
+                    self.sample_rate, self.audio_data = wav.read(path)
                 # Ensure we work with int16 mono for this demo to ensure algorithm stability
-                if self.audio_data.dtype != np.int16:
-                    self.audio_data = (self.audio_data * 32767).astype(np.int16)
                 if len(self.audio_data.shape) > 1:
                     # NOTE: This converts Stereo to Mono, halving the file size.
+                    # Done first so only the kept channel gets converted below.
                     self.audio_data = self.audio_data[:, 0]
+                dtype = self.audio_data.dtype
+                if dtype != np.int16:
+                    if dtype.kind == 'f':
+                        # Float WAVs hold samples in [-1.0, 1.0]
+                        self.audio_data = (self.audio_data * 32767).astype(np.int16)
+                    elif dtype == np.uint8:
+                        # 8-bit WAVs are unsigned, centred on 128
+                        self.audio_data = (self.audio_data.astype(np.int16) - 128) << 8
+                    else:
+                        # 32-bit PCM (24-bit files are read as int32 too): keep the top 16 bits
+                        self.audio_data = (self.audio_data >> 16).astype(np.int16)
+                # One channel of a mapped stereo file is a strided view; copy it
+                # out once so every later step (encoders, plots, playback) gets
+                # contiguous samples instead of making its own copy.
+                # Mono int16 files stay memory-mapped.
+                self.audio_data = np.ascontiguousarray(self.audio_data)
                 
                 duration = self.audio_data.size / self.sample_rate
                 info = f"{os.path.basename(path)} | {self.sample_rate}Hz | {duration:.1f}s"
                 self.lbl_carrier.config(text=info, foreground="#28a745")
                 self.processed_audio = None 
-                self.update_capacity_check()
-                self.update_plots()
+                self._display_original = None
+                self._display_stego = None
+                self.mark_dirty('capacity', 'plots')
             except Exception as e:
                 messagebox.showerror("Error", str(e))
 
@@ -506,9 +633,10 @@ class AudioStegoApp:
         path = filedialog.askopenfilename()
         if path:
             self.payload_path = path
-            size_kb = os.path.getsize(path) / 1024
+            self.payload_size = os.path.getsize(path)
+            size_kb = self.payload_size / 1024
             self.lbl_payload.config(text=f"{os.path.basename(path)} ({size_kb:.2f} KB)", foreground="#28a745")
-            self.update_capacity_check()
+            self.mark_dirty('capacity')
 
     def load_decode_audio(self):
         path = filedialog.askopenfilename(filetypes=[("WAV files", "*.wav")])
@@ -516,11 +644,16 @@ class AudioStegoApp:
             self.decode_audio_path = path
             self.lbl_decode_file.config(text=os.path.basename(path), foreground="#28a745")
             
-            # Load into memory for manipulation
+            # Memory-map instead of loading into RAM: extract_file only reads the
+            # header and payload samples, so most of the file is never touched
             try:
-                sr, audio = wav.read(path)
+                try:
+                    sr, audio = wav.read(path, mmap=True)
+                except ValueError:
+                    # Formats SciPy cannot map (e.g. 24-bit PCM) need a full read
+                    sr, audio = wav.read(path)
                 if len(audio.shape) > 1: audio = audio[:, 0]
-                self.decode_audio_data = audio.astype(np.int16)
+                self.decode_audio_data = audio.astype(np.int16, copy=False)
                 self.sample_rate = sr # Update rate for playback
                 self.btn_extract.config(state="normal")
                 self.btn_play_decode.config(state="normal")
@@ -570,7 +703,7 @@ class AudioStegoApp:
     # by Kadir Tekeli (MIT License 2016-2017)
     # =============================================================================
 
-    def update_algo_description(self, event=None):
+    def update_algo_description(self, event=None, algo=None):
         """
         Update the algorithm description label in the UI based on selected algorithm.
         
@@ -579,8 +712,12 @@ class AudioStegoApp:
         - Echo Hiding: More robust (survives some compression), lower capacity
         - Spread Spectrum (DSSS): Very robust to noise, very low capacity 
         - Phase Coding: Good imperceptibility, moderate capacity
+        
+        Args:
+            algo: Algorithm name; read from the UI when not given
         """
-        algo = self.algo_var.get()
+        if algo is None:
+            algo = self.algo_var.get()
         desc = ""
         if "LSB" in algo:
             desc = "Best for: Capacity. Fragile. 1 bit per sample."
@@ -593,7 +730,7 @@ class AudioStegoApp:
             desc = "Best for: Imperceptibility. Hides in Phase (8 bits per 256 samples)."
         self.algo_desc_lbl.config(text=desc)
 
-    def get_max_kb(self):
+    def get_max_kb(self, algo=None):
         """
         Calculate the maximum payload capacity in kilobytes for the selected algorithm.
         
@@ -603,12 +740,16 @@ class AudioStegoApp:
         - DSSS: 1 bit per 8192 samples (very low capacity, but robust)
         - Phase Coding: 8 bits per 256-sample segment
         
+        Args:
+            algo: Algorithm name; read from the UI when not given
+            
         Returns:
             float: Maximum payload size in kilobytes (KB)
         """
         if self.audio_data is None: return 0
         total_samples = self.audio_data.size
-        algo = self.algo_var.get()
+        if algo is None:
+            algo = self.algo_var.get()
         
         # Reserve 4 bytes for header overhead plus safety margin
         header_bytes = 4
@@ -691,14 +832,37 @@ class AudioStegoApp:
         # Format: little-endian, 2-char string, 1 byte, 3 unsigned shorts, 1 unsigned int
         data = struct.pack('<2sBHHHI', magic, algo_id, param1, param2, param3, payload_len)
         
-        # Calculate simple checksum: sum of all bytes, masked to 16 bits
+        # Calculate CRC-16 over all 13 bytes
         # This allows detection of header corruption during decoding
-        checksum = sum(data) & 0xFFFF
+        checksum = self.calculate_crc16(data)
         
         # Append CRC as final 2 bytes (unsigned short)
         full_header = data + struct.pack('<H', checksum)
         return full_header  # Total: 13 + 2 = 15 bytes
 
+    @functools.lru_cache(maxsize=128)
+    def smart_header_bits(self, algo_id, param1, param2, param3, payload_len):
+        """
+        create_smart_header() unpacked to 120 bits, ready for LSB embedding.
+        
+        Cached because every preview rebuilds the same header for the same
+        settings. The array is shared between calls, so it is made read-only.
+        """
+        header = self.create_smart_header(algo_id, param1, param2, param3, payload_len)
+        bits = np.unpackbits(np.frombuffer(header, dtype=np.uint8))
+        bits.flags.writeable = False
+        return bits
+
+    def calculate_crc16(self, data):
+        """
+        CRC-16-CCITT (XMODEM: poly 0x1021, init 0) of a bytes-like object.
+        
+        binascii.crc_hqx is the table-driven C implementation from the standard
+        library, so this is cheap even for whole payloads, and it catches far
+        more corruption patterns than a plain byte sum.
+        """
+        return binascii.crc_hqx(data, 0)
+
     # Fixed offset where payload data starts (samples 0-999 reserved for header)
     # Header only needs 120 bits (15 bytes * 8), but we use 1000 for safety margin
     HEADER_OFFSET = 1000
@@ -716,7 +880,7 @@ class AudioStegoApp:
         
         Decoding Process:
         1. Extract LSB (bit 0) from first 120 samples → 120 bits = 15 bytes
-        2. Pack bits back into bytes using np.packbits()
+        2. Pack bits back into bytes (both done at once by lsb_extract_bytes())
         3. Unpack the header structure using struct.unpack()
         4. Validate magic bytes ('st') and CRC checksum
         
@@ -730,15 +894,10 @@ class AudioStegoApp:
             # Audio must have at least 120 samples for the header
             if len(audio) < bits_needed: return None
             
-            # Extract LSB from each of the first 120 samples
-            # audio[:bits_needed] & 1 performs bitwise AND with 1, isolating bit 0
-            # This gives an array of 120 values, each being 0 or 1
-            header_bits = audio[:bits_needed] & 1
-            
-            # Convert 120 individual bits back into 15 bytes
-            # np.packbits() groups every 8 bits into a single byte (MSB first)
-            # .tobytes() converts the numpy array to a Python bytes object
-            header_bytes = np.packbits(header_bits).tobytes()
+            # Extract LSB from each of the first 120 samples and group every
+            # 8 bits into a single byte (MSB first), giving the 15 header bytes
+            # without building an intermediate array of 120 bits
+            header_bytes = self.lsb_extract_bytes(audio, 0, header_len)
             
             # Unpack the 15-byte structure using the same format as create_smart_header
             # Format: '<2sBHHHIH' adds the 2-byte CRC at the end
@@ -756,8 +915,10 @@ class AudioStegoApp:
             # Validate CRC checksum
             # CRC is calculated over the first 13 bytes (everything except the CRC itself)
             data_part = header_bytes[:-2]  # First 13 bytes
-            calc_crc = sum(data_part) & 0xFFFF  # Sum of bytes, masked to 16 bits
-            if calc_crc != crc: return None  # CRC mismatch = corrupted header
+            calc_crc = self.calculate_crc16(data_part)
+            # Files written by older versions carry a byte-sum checksum instead
+            legacy_crc = sum(data_part) & 0xFFFF
+            if crc not in (calc_crc, legacy_crc): return None  # CRC mismatch = corrupted header
             
             # Return parsed header as a dictionary for easy access
             return {'algo_id': algo_id, 'p1': p1, 'p2': p2, 'p3': p3, 'payload_len': length}
@@ -773,10 +934,14 @@ class AudioStegoApp:
         Compares the payload file size against the maximum capacity calculated by
         get_max_kb(). Enables or disables the encode button based on capacity.
         """
+        # Read the selected algorithm once for the description and the capacity
+        algo = self.algo_var.get()
+        
+        # The description does not depend on the carrier, keep it current regardless
+        self.update_algo_description(algo=algo)
         if not self.carrier_path: return
 
-        limit_kb = self.get_max_kb()
-        self.update_algo_description()
+        limit_kb = self.get_max_kb(algo)
         
         if not self.payload_path:
             # No payload selected yet, just show maximum available capacity
@@ -784,7 +949,7 @@ class AudioStegoApp:
             return
 
         # Calculate payload size in KB
-        payload_kb = os.path.getsize(self.payload_path) / 1024
+        payload_kb = self.payload_size / 1024
         # Reserve 32 bytes of overhead for header + safety margin
         header_kb = 32 / 1024 
         
@@ -794,116 +959,166 @@ class AudioStegoApp:
             self.btn_bake.state(['disabled'])
             self.btn_play_stego.state(['disabled'])
         else:
-            # Payload fits - enable encoding buttons
+            # Payload fits - enable encoding buttons, unless an encode is still
+            # running (set_busy() re-runs this check once it is done)
             self.status_lbl.config(text=f"Ready: File fits ({payload_kb:.2f} KB / {limit_kb:.2f} KB)", foreground="#28a745")
-            self.btn_bake.state(['!disabled'])
-            self.btn_play_stego.state(['!disabled'])
+            if not self._busy_jobs:
+                self.btn_bake.state(['!disabled'])
+                self.btn_play_stego.state(['!disabled'])
 
-    def process_steganography(self):
+    def process_steganography(self, settings=None, audio=None, payload_path=None):
         """
         Main encoding function: embed payload into audio using selected algorithm.
         
         Encoding Workflow:
-        1. Load the payload file as raw bytes
-        2. Convert bytes to a bit array using np.unpackbits()
-        3. Create the 15-byte Smart Header with algorithm parameters
-        4. Embed header at samples 0-119 using LSB encoding
-        5. Embed payload starting at sample 1000 using the selected algorithm
+        1. Memory-map the payload file as a uint8 array (unpacked to bits only
+           for non-LSB algorithms)
+        2. Create the 15-byte Smart Header with algorithm parameters
+        3. Embed payload starting at sample 1000 using the selected algorithm
+        4. Embed header at samples 0-119 of the result using LSB encoding
         
         The header is ALWAYS LSB-encoded regardless of the payload algorithm.
         This allows the decoder to read the header first and determine which
         algorithm to use for the payload.
         
+        Args:
+            settings: Result of snapshot_encoder(), required when called from a
+                      worker thread (default: read from the UI now)
+            audio, payload_path: Carrier and payload file, captured on the main
+                      thread by worker callers (default: the loaded ones)
+        
         Returns:
             np.ndarray: Modified audio with embedded data, or None on error
         """
-        if self.audio_data is None or self.payload_path is None: return None
-
-        # =================================================================
-        # STEP 1: Load Payload as Raw Bytes
-        # =================================================================
-        with open(self.payload_path, 'rb') as f:
-            data = f.read()
-        payload_len = len(data)
+        if audio is None: audio = self.audio_data
+        if payload_path is None: payload_path = self.payload_path
+        if audio is None or payload_path is None: return None
 
         # =================================================================
-        # STEP 2: Convert Payload Bytes to Bit Array
+        # STEP 1: Map Payload File as a uint8 Array
         # =================================================================
-        # np.frombuffer() interprets the bytes as unsigned 8-bit integers (0-255)
-        byte_array = np.frombuffer(data, dtype=np.uint8)
-        # np.unpackbits() expands each byte into 8 individual bits (MSB first)
-        # Example: byte 0x4D (77) becomes [0,1,0,0,1,1,0,1]
-        bits_to_encode = np.unpackbits(byte_array)
-        
-        # Create a copy of audio to modify (preserve original for comparison)
-        audio_copy = self.audio_data.copy()
-        algo_name = self.algo_var.get()
+        # np.memmap() exposes the file as unsigned 8-bit integers (0-255)
+        # without reading it into a bytes object first: the OS pages it in
+        # as the encoder walks through it. (An empty file cannot be mapped.)
+        payload_len = os.path.getsize(payload_path)
+        if payload_len:
+            byte_array = np.memmap(payload_path, dtype=np.uint8, mode='r')
+        else:
+            byte_array = np.zeros(0, dtype=np.uint8)
+        
         start_offset = self.HEADER_OFFSET  # 1000 samples
         
         # =================================================================
-        # STEP 3: Determine Algorithm ID and Parameters
+        # STEP 2: Determine Algorithm ID and Parameters
         # =================================================================
         # Algorithm IDs: 1=LSB, 2=Echo, 3=Phase, 4=DSSS
-        algo_id = 1
-        p1, p2, p3 = 0, 0, 0  # Default parameters
-        
-        if "Echo" in algo_name:
-            algo_id = 2
-            p1 = self.echo_chunk_size.get()  # Samples per bit (default: 2048)
-            p2 = self.echo_delay_0.get()     # Echo delay for bit 0 (default: 50)
-            p3 = self.echo_delay_1.get()     # Echo delay for bit 1 (default: 200)
-        elif "Spread Spectrum" in algo_name:
-            algo_id = 4
-            p1 = 8192  # Frame size (fixed, 8192 samples per bit)
-            p2 = 0
-            p3 = 0
-        elif "Phase" in algo_name:
-            algo_id = 3
-            p1 = 256  # Segment size (256 samples)
-            p2 = 20   # Starting frequency bin
-            p3 = 0
+        if settings is None:
+            settings = self.snapshot_encoder()
+        algo_id, p1, p2, p3, encoder = settings
             
-        # =================================================================
-        # STEP 4: Create and Embed Header (Always LSB)
-        # =================================================================
-        header = self.create_smart_header(algo_id, p1, p2, p3, payload_len)
-        # Convert header bytes to bits for LSB embedding
-        header_bits = np.unpackbits(np.frombuffer(header, dtype=np.uint8))
+        # Header as bits for LSB embedding
+        header_bits = self.smart_header_bits(algo_id, p1, p2, p3, payload_len)
         
         # Check audio is long enough for header + payload offset
-        if len(audio_copy) < len(header_bits) + start_offset:
-            self.update_status("Error: Audio too short.")
+        if len(audio) < len(header_bits) + start_offset:
+            # Schedule UI update on the main thread (required for Tkinter)
+            self.root.after(0, lambda: self.status_lbl.config(text="Error: Audio too short.", foreground="#d9534f"))
             return None
         
+        # =================================================================
+        # STEP 3: Encode Payload Using Selected Algorithm
+        # =================================================================
+        # Every encoder returns a new array and leaves the carrier as it is
+        # (the original is kept for comparison), so no copy is needed up front.
+        # Payload data starts at HEADER_OFFSET (sample 1000) to avoid header
+        if algo_id == 1:
+            # LSB works on the packed bytes directly (see lsb_embed_bytes),
+            # in place, so it is the one path that copies the carrier first
+            audio_copy = self.lsb_embed_bytes(audio.copy(), byte_array, start_offset)
+        else:
+            # The other algorithms take a bit array:
+            # np.unpackbits() expands each byte into 8 individual bits (MSB first)
+            # Example: byte 0x4D (77) becomes [0,1,0,0,1,1,0,1]
+            bits_to_encode = np.unpackbits(byte_array)
+            audio_copy = encoder(audio, bits_to_encode, start_offset=start_offset)
+        
+        # =================================================================
+        # STEP 4: Embed Header (Always LSB)
+        # =================================================================
+        # The encoders never touch samples before start_offset, so writing the
+        # header afterwards gives the same result as writing it first.
+        #
         # Embed header using LSB encoding at the start of audio (samples 0-119)
-        # This line performs bitwise manipulation to replace the LSB of each sample:
+        # algo_lsb_encode replaces the LSB of each sample in place:
         #
-        # audio_copy[:len(header_bits)]         - Select first 120 audio samples
-        # & ~1                                   - Clear bit 0 (AND with 11111110)
-        #                                        ~1 is bitwise NOT of 1 = ...11111110
-        # | header_bits                         - Set bit 0 to header bit value (OR)
+        # & ~1          - Clear bit 0 (AND with 11111110)
+        #                 ~1 is bitwise NOT of 1 = ...11111110
+        # | header_bits - Set bit 0 to header bit value (OR)
         #
         # Example: sample = 1234 (binary: 10011010010)
         #          header_bit = 1
         #          (1234 & ~1) | 1 = (1234 & -2) | 1 = 1234 | 1 = 1235
-        audio_copy[:len(header_bits)] = (audio_copy[:len(header_bits)] & ~1) | header_bits
+        #
+        # The header bits come unpacked from the smart_header_bits() cache. For
+        # 120 samples this is faster than lsb_embed_bytes(), whose word path
+        # only pays off on long runs.
+        return self.algo_lsb_encode(audio_copy, header_bits, start_index=0)
+
+    def get_algorithm_params(self, algo_name):
+        """
+        Map an algorithm name from the UI to its Smart Header ID and parameters.
         
-        # =================================================================
-        # STEP 5: Encode Payload Using Selected Algorithm
-        # =================================================================
-        # Payload data starts at HEADER_OFFSET (sample 1000) to avoid header
+        Returns:
+            tuple: (algo_id, p1, p2, p3) as stored in the Smart Header
+                - LSB (1): unused
+                - Echo (2): chunk_size, delay_0, delay_1
+                - Phase (3): segment_size, start_bin, unused
+                - DSSS (4): frame_size, unused, unused
+        """
+        if "Echo" in algo_name:
+            # Samples per bit (default: 2048), echo delays for bit 0 / bit 1
+            return 2, self.echo_chunk_size.get(), self.echo_delay_0.get(), self.echo_delay_1.get()
+        elif "Spread Spectrum" in algo_name:
+            return 4, 8192, 0, 0  # Frame size (fixed, 8192 samples per bit)
+        elif "Phase" in algo_name:
+            return 3, 256, 20, 0  # Segment size (256 samples), starting frequency bin
+        return 1, 0, 0, 0
+
+    def snapshot_encoder(self):
+        """
+        Read the selected algorithm and its settings from the UI.
+        
+        Tk variables may only be read on the main thread, so this is called
+        there before encoding is handed to a worker thread.
+        
+        Returns:
+            tuple: (algo_id, p1, p2, p3, encoder) for process_steganography()
+                   and generate_preview()
+        """
+        algo_id, p1, p2, p3 = self.get_algorithm_params(self.algo_var.get())
+        return algo_id, p1, p2, p3, self.make_encoder(algo_id, p1, p2, p3)
+
+    def make_encoder(self, algo_id, p1, p2, p3):
+        """
+        Return the payload encoder for algo_id with its parameters bound.
+        
+        The parameters are read from the UI once here and baked into the
+        returned callable, so the encoder itself does no Tk variable lookups.
+        
+        Returns:
+            callable: encoder(audio, bits, start_offset) -> np.ndarray, always a
+                      new array (audio itself is left unmodified)
+        """
         if algo_id == 2:  # Echo Hiding
-            return self.algo_echo_encode(audio_copy, bits_to_encode, start_offset=start_offset, payload_len=payload_len)
+            return functools.partial(self.algo_echo_encode, chunk_size=p1, d0=p2, d1=p3, alpha=self.echo_alpha.get())
         elif algo_id == 4:  # Spread Spectrum (DSSS)
-            return self.algo_spread_spectrum_encode(audio_copy, bits_to_encode, start_offset=start_offset)
+            return functools.partial(self.algo_spread_spectrum_encode, frame_size=p1)
         elif algo_id == 3:  # Phase Coding
-            return self.algo_phase_encode(audio_copy, bits_to_encode, start_offset=start_offset)
-        elif algo_id == 1:  # LSB (default)
-            return self.algo_lsb_encode(audio_copy, bits_to_encode, start_index=start_offset)
-        
-        return audio_copy
+            return self.algo_phase_encode
+        # LSB (default) names its offset argument start_index and works in place
+        return lambda audio, bits, start_offset: self.algo_lsb_encode(audio.copy(), bits, start_index=start_offset)
 
-    def generate_preview(self):
+    def generate_preview(self, settings=None, audio=None):
         """
         Generate a preview of the steganography effect without a real payload.
         
@@ -916,52 +1131,43 @@ class AudioStegoApp:
         - Echo: Visible amplitude changes where echoes are added
         - Phase: Minimal visible change (phase is imperceptible)
         - DSSS: Wide-spread low-amplitude noise
+        
+        Args:
+            settings: Result of snapshot_encoder(), required when called from a
+                      worker thread (default: read from the UI now)
+            audio: Carrier captured on the main thread by worker callers
+                   (default: the loaded one)
+        
+        Returns:
+            np.ndarray: Preview stego audio, or None on error
         """
-        if self.audio_data is None: return
+        if audio is None: audio = self.audio_data
+        if audio is None: return None
         
         # Use 512 bytes as dummy payload size for preview visualization
         dummy_len = 512
-        audio_copy = self.audio_data.copy()
-        algo_name = self.algo_var.get()
         start_offset = self.HEADER_OFFSET
         
         # Create a header for the preview (same format as real encoding)
         # This ensures the preview matches what the actual output would look like
-        algo_id = 1
-        p1=0; p2=0; p3=0
-        if "Echo" in algo_name: 
-            algo_id = 2
-            p1=self.echo_chunk_size.get(); p2=100; p3=150
-        elif "Spread Spectrum" in algo_name:
-            algo_id = 4
-            p1=8192
-        elif "Phase" in algo_name: 
-            algo_id = 3
-            p1=256; p2=20
+        if settings is None:
+            settings = self.snapshot_encoder()
+        algo_id, p1, p2, p3, encoder = settings
             
-        # Create and embed the header in LSB
-        header = self.create_smart_header(algo_id, p1, p2, p3, dummy_len)
-        header_bits = np.unpackbits(np.frombuffer(header, dtype=np.uint8))
-        audio_copy[:len(header_bits)] = (audio_copy[:len(header_bits)] & ~1) | header_bits
+        header_bits = self.smart_header_bits(algo_id, p1, p2, p3, dummy_len)
         
         # Generate 1000 random bits (0 or 1) as dummy payload data
         bits = np.random.randint(0, 2, 1000)
         
         try:
-            # Encode dummy bits using the selected algorithm
-            if algo_id == 2:
-                self.processed_audio = self.algo_echo_encode(audio_copy, bits, start_offset=start_offset, payload_len=125)
-            elif algo_id == 4:
-                self.processed_audio = self.algo_spread_spectrum_encode(audio_copy, bits, start_offset=start_offset)
-            elif algo_id == 3:
-                self.processed_audio = self.algo_phase_encode(audio_copy, bits, start_offset=start_offset)
-            else:
-                self.processed_audio = self.algo_lsb_encode(audio_copy, bits, start_index=start_offset)
+            # Encode dummy bits using the selected algorithm (returns a new array)
+            audio_copy = encoder(audio, bits, start_offset=start_offset)
             
-            # Schedule UI update on the main thread (required for Tkinter)
-            self.root.after(0, self.update_plots)
+            # Embed the header in LSB
+            return self.algo_lsb_encode(audio_copy, header_bits, start_index=0)
         except Exception as e:
             print(f"Preview Error: {e}")
+            return None
 
 
     # =============================================================================
@@ -1020,15 +1226,95 @@ class AudioStegoApp:
         #   sample & ~1 = 12344                        # Clear bit 0
         #   12344 | 1   = 12345                        # Set bit 0 to 1
         #   12344 | 0   = 12344                        # Set bit 0 to 0
-        audio[start_index:start_index+len(bits)] = (audio[start_index:start_index+len(bits)] & ~1) | bits
+        #
+        # The in-place operators work on a view of the samples, so no temporary
+        # copy of the region is made between the AND and the OR.
+        region = audio[start_index:start_index+len(bits)]
+        region &= ~1
+        region |= bits
         return audio
 
+    # SWAR tables for lsb_embed_bytes(). A little-endian uint64 word holds four
+    # int16 samples, one per 16-bit lane; LSB_LANE_MASK selects bit 0 of each lane.
+    # Entry b of LSB_BYTE_LANES is byte b spread over two words (8 samples), MSB
+    # first, with every bit already sitting in its lane's bit 0. The two words are
+    # stored as one opaque 16-byte item so np.take() copies them in a single step.
+    LSB_LANE_MASK = np.uint64(0x0001000100010001)
+    LSB_BYTE_LANES = np.ascontiguousarray(np.bitwise_or.reduce(
+        np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).astype(np.uint64).reshape(256, 2, 4)
+        << (np.arange(4, dtype=np.uint64) * np.uint64(16)),
+        axis=2)).view('V16').reshape(256)
+
+    def lsb_embed_bytes(self, audio, data, start_index=0):
+        """
+        LSB-embed packed bytes, same result as algo_lsb_encode(audio, np.unpackbits(data)).
+        
+        Instead of expanding the payload to one array element per bit and
+        combining it with the samples one int16 at a time, the samples are
+        viewed as uint64 words (4 samples each) and every payload byte is looked
+        up in LSB_BYTE_LANES as two ready-made words. Clearing and setting the
+        LSBs then takes one AND and one OR per 4 samples.
+        
+        Falls back to the per-bit path when the audio cannot be viewed as words
+        (non-contiguous, not int16, or a big-endian machine), and for a final
+        partial byte when the audio runs out.
+        
+        Args:
+            audio: int16 audio sample array (modified in-place)
+            data: Payload as bytes or a uint8 array
+            start_index: Sample index to start embedding (default: 0)
+        
+        Returns:
+            np.ndarray: Modified audio with embedded bytes
+        """
+        data = np.frombuffer(data, dtype=np.uint8) if isinstance(data, (bytes, bytearray, memoryview)) else data
+        # Whole bytes that fit, i.e. 8 samples each
+        n = min(len(data), max(len(audio) - start_index, 0) // 8)
+        region = audio[start_index:start_index + 8 * n]
+        
+        if (region.dtype != np.int16 or not region.flags.c_contiguous
+                or region.dtype.byteorder == '>' or not np.little_endian):
+            return self.algo_lsb_encode(audio, np.unpackbits(data), start_index)
+        
+        words = region.view(np.uint64)
+        words &= ~self.LSB_LANE_MASK
+        words |= np.take(self.LSB_BYTE_LANES, data[:n]).view(np.uint64)
+        
+        if n < len(data):
+            # Fewer than 8 samples left: embed what fits of the next byte
+            self.algo_lsb_encode(audio, np.unpackbits(data[n:n + 1]), start_index + 8 * n)
+        return audio
+
+    def frame_view(self, signal, start, frame_size, num_frames, writeable=False):
+        """
+        View signal[start:start + num_frames * frame_size] as a (num_frames, frame_size) matrix.
+        
+        Unlike reshape(), this never copies, even when signal is itself a strided
+        view (e.g. one channel of a stereo file), so every frame-wise algorithm can
+        process all frames in one batched call and write straight back into signal.
+        
+        Args:
+            signal: 1-D sample array
+            start: Index of the first sample of frame 0
+            frame_size: Samples per frame (one row)
+            num_frames: Number of frames (rows)
+            writeable: Allow writing through the view (default: read-only)
+        
+        Returns:
+            np.ndarray: 2-D view sharing memory with signal
+        """
+        if start < 0 or start + num_frames * frame_size > len(signal):
+            raise ValueError("Frames extend past the end of the signal")
+        step = signal.strides[0]
+        return np.lib.stride_tricks.as_strided(signal[start:], shape=(num_frames, frame_size),
+                                               strides=(frame_size * step, step), writeable=writeable)
+
     # NOTE: The _create_mixer_signal function below was ported from the MATLAB
     # library's mixer.m but is NOT currently used in this implementation.
     # It was intended for smooth transitions between echo hiding segments.
     # Kept for reference but could be removed to clean up the codebase.
 
-    def algo_echo_encode(self, audio, bits, start_offset=1000, payload_len=None):
+    def algo_echo_encode(self, audio, bits, start_offset=1000, payload_len=None, chunk_size=None, d0=None, d1=None, alpha=None):
         """
         Echo Hiding Encoding Algorithm.
         
@@ -1055,18 +1341,16 @@ class AudioStegoApp:
             bits: Array of bits (0 or 1) to embed
             start_offset: Sample index to start embedding (default: 1000)
             payload_len: Unused, kept for API compatibility
+            chunk_size, d0, d1, alpha: Echo parameters (default: read from UI)
         
         Returns:
             np.ndarray: New audio array with embedded echoes
         """
-        # Import lfilter here to avoid slow startup (lazy import)
-        from scipy.signal import lfilter
-        
-        # Get user-configurable echo parameters from UI
-        chunk_size = self.echo_chunk_size.get()  # Samples per bit (default: 2048)
-        d0 = self.echo_delay_0.get()             # Delay for bit 0 (default: 50 samples)
-        d1 = self.echo_delay_1.get()             # Delay for bit 1 (default: 200 samples)
-        alpha = self.echo_alpha.get()            # Echo strength 0.0-1.0 (default: 0.5)
+        # Get user-configurable echo parameters from UI unless bound by the caller
+        if chunk_size is None: chunk_size = self.echo_chunk_size.get()  # Samples per bit (default: 2048)
+        if d0 is None: d0 = self.echo_delay_0.get()                     # Delay for bit 0 (default: 50 samples)
+        if d1 is None: d1 = self.echo_delay_1.get()                     # Delay for bit 1 (default: 200 samples)
+        if alpha is None: alpha = self.echo_alpha.get()                 # Echo strength 0.0-1.0 (default: 0.5)
         
         num_bits = len(bits)
         total_samples = num_bits * chunk_size
@@ -1077,48 +1361,33 @@ class AudioStegoApp:
             num_bits = available // chunk_size
             bits = bits[:num_bits]
             if num_bits <= 0:
-                return audio
-        
-        # Create echo kernels (impulse responses)
-        # Each kernel is [0, 0, ..., 0, alpha] with 'delay' zeros before alpha
-        #
-        # When convolved with audio signal x[n], this produces:
-        #   y[n] = x[n-delay] * alpha
-        # which is exactly an echo delayed by 'delay' samples with amplitude 'alpha'
+                return audio.copy()
+        
+        # Only the embed region changes, so only it is converted to float32
+        # (for precision while adding the echoes); the rest is copied as is.
+        # View the embed region as one row per bit: row i is chunk i. The
+        # echoes are read from the int16 view, so one float32 buffer suffices.
+        chunks = self.frame_view(audio, start_offset, chunk_size, num_bits)
+        region = chunks.astype(np.float32)
+        alpha = np.float32(alpha)
+        is_zero = np.asarray(bits) == 0
+        
+        # Convolving a chunk with the kernel [0, 0, ..., 0, alpha] ('delay' zeros)
+        # gives y[n] = alpha * x[n - delay], and nothing for the first 'delay'
+        # samples since each chunk is filtered on its own (zero initial state).
+        # So the echo is just the chunk shifted right by 'delay' and scaled:
+        # add it to all rows of one bit value at once instead of per chunk.
         #
-        # Example: d0=50, alpha=0.5 creates kernel of length 51
-        # kernel = [0, 0, 0, ... (50 zeros) ..., 0.5]
-        kernel_d0 = np.zeros(d0 + 1, dtype=np.float32)
-        kernel_d0[-1] = alpha  # Set last element to alpha
-        kernel_d1 = np.zeros(d1 + 1, dtype=np.float32)
-        kernel_d1[-1] = alpha
-        
-        # Work with float32 for precision during convolution
-        output = audio.copy().astype(np.float32)
-        
-        # Process each bit by adding echo to its corresponding chunk
-        for i, bit in enumerate(bits):
-            chunk_start = start_offset + i * chunk_size
-            chunk_end = chunk_start + chunk_size
-            
-            if chunk_end > len(audio):
-                break
-            
-            # Extract the chunk to process
-            chunk = audio[chunk_start:chunk_end].astype(np.float32)
-            
-            # Select kernel based on bit value
-            kernel = kernel_d0 if bit == 0 else kernel_d1
-            
-            # lfilter performs 1D convolution (FIR filtering)
-            # lfilter(b, a, x) computes: y[n] = sum(b[k] * x[n-k]) / sum(a[k] * y[n-k])
-            # With a=1.0, this simplifies to pure FIR (no feedback): y = conv(b, x)
-            # Result is the echo signal, which we add to the output
-            echo = lfilter(kernel, 1.0, chunk)
-            output[chunk_start:chunk_end] += echo
+        # Example: d0=50, alpha=0.5 → output[50:] += 0.5 * chunk[:-50]
+        for rows, delay in ((is_zero, d0), (~is_zero, d1)):
+            if delay < chunk_size:
+                region[rows, delay:] += alpha * chunks[rows, :chunk_size - delay]
         
-        # Clip to int16 range and convert back to integer samples
-        return np.clip(output, -32768, 32767).astype(np.int16)
+        # Clip to int16 range in place and write back as integer samples
+        np.clip(region, -32768, 32767, out=region)
+        output = audio.copy()
+        self.frame_view(output, start_offset, chunk_size, num_bits, writeable=True)[:] = region
+        return output
 
     def algo_phase_encode(self, audio, bits, start_offset=1000):
         """
@@ -1162,58 +1431,68 @@ class AudioStegoApp:
         bits_per_segment = 8    # Use 8 frequency bins per segment = 1 byte
         min_magnitude = 500     # Boost weak bins to ensure reliable decoding
         
-        # Work with float64 for FFT precision
-        output = audio.copy().astype(np.float64)
-        bit_idx = 0
-        pos = start_offset
-        
-        # Process audio in 256-sample segments
-        while bit_idx < len(bits) and pos + segment_size <= len(audio):
-            # Extract segment for processing
-            segment = output[pos:pos + segment_size]
-            
-            # Forward FFT: transform from time domain to frequency domain
-            # rfft returns only positive frequencies (symmetric for real signals)
-            # Result is array of complex numbers: magnitude + phase
-            spectrum = np.fft.rfft(segment)
-            
-            # Decompose complex spectrum into magnitude and phase components
-            # Complex number z = |z| * e^(i*θ) = magnitude * e^(i*phase)
-            magnitude = np.abs(spectrum)  # |z| = sqrt(real² + imag²)
-            phase = np.angle(spectrum)    # θ = atan2(imag, real)
-            
-            # Embed 8 bits into frequency bins 20-27
-            for i in range(bits_per_segment):
-                if bit_idx >= len(bits):
-                    break
-                freq_bin = start_bin + i
-                if freq_bin >= len(magnitude):
-                    break
-                
-                # Boost weak frequency bins to ensure reliable decoding
-                # If a bin has very low magnitude, phase becomes noisy
-                if magnitude[freq_bin] < min_magnitude:
-                    magnitude[freq_bin] = min_magnitude
-                
-                # BPSK modulation: encode bit as phase angle
-                # bit 0 → phase = -π/2 (-90°)
-                # bit 1 → phase = +π/2 (+90°)
-                phase[freq_bin] = -np.pi/2 if bits[bit_idx] == 0 else np.pi/2
-                bit_idx += 1
-            
-            # Reconstruct complex spectrum from magnitude and phase
-            # Using Euler's formula: z = magnitude * e^(i*phase)
-            # np.exp(1j * phase) creates unit complex number at angle 'phase'
-            # Multiplying by magnitude scales it to correct amplitude
-            new_spectrum = magnitude * np.exp(1j * phase)
-            
-            # Inverse FFT: transform back from frequency to time domain
-            # irfft expects the positive-frequency half and reconstructs real signal
-            output[pos:pos + segment_size] = np.fft.irfft(new_spectrum, n=segment_size)
-            pos += segment_size
-        
-        # Clip to int16 range and convert back to integer samples
-        return np.clip(output, -32768, 32767).astype(np.int16)
+        # One 256-sample segment per 8 bits, as far as the audio allows
+        available = max(len(audio) - start_offset, 0) // segment_size
+        num_segments = min(-(-len(bits) // bits_per_segment), available)
+        if num_segments <= 0:
+            return audio.copy()
+        num_used = min(len(bits), num_segments * bits_per_segment)
+        
+        # Lay the bits out as one row of 8 per segment. The last row may be only
+        # partly filled, 'valid' marks which bins actually carry a bit.
+        bit_rows = np.zeros(num_segments * bits_per_segment, dtype=np.uint8)
+        bit_rows[:num_used] = bits[:num_used]
+        bit_rows = bit_rows.reshape(num_segments, bits_per_segment)
+        valid = (np.arange(num_segments * bits_per_segment) < num_used).reshape(num_segments, bits_per_segment)
+        
+        # View the embed region as a (num_segments, 256) matrix, one segment per row.
+        # Only this region changes, so only it is converted to float32: its ~24-bit
+        # precision is far finer than int16 samples, and scipy.fft keeps float32
+        # input as complex64, half the memory of float64
+        segments = self.frame_view(audio, start_offset, segment_size, num_segments).astype(np.float32)
+        
+        # Import scipy.fft here to avoid slow startup (lazy import)
+        # Unlike np.fft it can split the rows across all CPU cores (workers=-1)
+        import scipy.fft
+        
+        # Forward FFT of all segments at once (axis=1: along each row)
+        # rfft returns only positive frequencies (symmetric for real signals)
+        # Result is array of complex numbers: magnitude + phase
+        # overwrite_x is safe: segments is our own float32 copy
+        spectrum = scipy.fft.rfft(segments, axis=1, workers=-1, overwrite_x=True)
+        
+        # Embed 8 bits into frequency bins 20-27 of every segment
+        # Only these bins change, all other bins are passed through untouched
+        bins = slice(start_bin, start_bin + bits_per_segment)
+        target = spectrum[:, bins]
+        
+        # Complex number z = |z| * e^(i*θ) = magnitude * e^(i*phase)
+        magnitude = np.abs(target)  # |z| = sqrt(real² + imag²)
+        
+        # Boost weak frequency bins to ensure reliable decoding
+        # If a bin has very low magnitude, phase becomes noisy
+        np.maximum(magnitude, min_magnitude, out=magnitude)
+        
+        # BPSK modulation: encode bit as phase angle
+        # bit 0 → phase = -π/2 (-90°) → z = magnitude * e^(-iπ/2) = -1j * magnitude
+        # bit 1 → phase = +π/2 (+90°) → z = magnitude * e^(+iπ/2) = +1j * magnitude
+        # So the new bin value is written directly, no angle/exp round trip needed.
+        # Bins of a partly filled last segment that carry no bit keep their value.
+        sign = np.where(bit_rows == 0, np.complex64(-1j), np.complex64(1j))
+        spectrum[:, bins] = np.where(valid, sign * magnitude, target)
+        
+        # Inverse FFT: transform back from frequency to time domain
+        # irfft expects the positive-frequency half and reconstructs real signal
+        segments = scipy.fft.irfft(spectrum, n=segment_size, axis=1, workers=-1, overwrite_x=True)
+        
+        # Round to the nearest integer (plain casting would truncate towards
+        # zero and bias every sample), clip to int16 range, both in place,
+        # and write back as integer samples
+        np.rint(segments, out=segments)
+        np.clip(segments, -32768, 32767, out=segments)
+        output = audio.copy()
+        self.frame_view(output, start_offset, segment_size, num_segments, writeable=True)[:] = segments
+        return output
 
     # --- Decoding Logic ---
 
@@ -1244,35 +1523,46 @@ class AudioStegoApp:
             self.log(f"Header Found! AlgoID: {algo_id}, Len: {payload_len} bytes")
             
             decoded_bits = []
+            payload_bytes = None  # Set directly by decoders that produce bytes
+            # Each decoder only gets the samples that actually carry the payload,
+            # so the unused tail of a memory-mapped file is never read from disk
+            total_bits_needed = payload_len * 8
             
             if algo_id == 2: # Echo Hiding
                 chunk = header['p1']
                 d0 = header['p2']
                 d1 = header['p3']
                 self.log(f"Algorithm: Echo Hiding (Chunk={chunk}, D0={d0}, D1={d1})")
+                audio = audio[:start_offset + total_bits_needed * chunk]
                 decoded_bits = self.algo_echo_decode(audio, start_offset=start_offset, chunk_size=chunk, d0=d0, d1=d1)
                 
             elif algo_id == 3: # Phase Coding
                 segment = header['p1']
                 start_bin = header['p2']
                 self.log(f"Algorithm: Phase Coding (Segment={segment}, StartBin={start_bin})")
+                audio = audio[:start_offset + math.ceil(total_bits_needed / 8) * segment]  # 8 bits per segment
                 decoded_bits = self.algo_phase_decode(audio, start_offset=start_offset, segment_size=segment, start_bin=start_bin)
             
             elif algo_id == 4: # Spread Spectrum
                 frame_size = header['p1']
                 self.log(f"Algorithm: Spread Spectrum (FrameSize={frame_size})")
+                audio = audio[:start_offset + total_bits_needed * frame_size]
                 decoded_bits = self.algo_spread_spectrum_decode(audio, start_offset=start_offset, frame_size=frame_size)
             
             elif algo_id == 1: # LSB
                 self.log("Algorithm: LSB")
-                decoded_bits = self.algo_lsb_decode(audio, start_index=start_offset)
+                # Read the bytes straight from the sample LSBs (see lsb_extract_bytes)
+                payload_bytes = self.lsb_extract_bytes(audio, start_offset, payload_len)
+                # Bits of the first 4 bytes, only for the debug log below
+                decoded_bits = np.unpackbits(np.frombuffer(payload_bytes[:4], dtype=np.uint8))
                 
             else:
                 self.log(f"Error: Unknown Algorithm ID {algo_id}")
                 return
 
             # 2. Trim/Process Bits
-            if len(decoded_bits) == 0:
+            # (an empty payload legitimately decodes to nothing and is saved as an empty file)
+            if len(decoded_bits) == 0 and payload_len > 0:
                  self.log("Error: Decoder returned no data.")
                  return
 
@@ -1282,23 +1572,26 @@ class AudioStegoApp:
             self.log(f"Debug - First 32 bits: {bit_str}")
 
             # 3. Reconstruct Payload
-            total_bits_needed = payload_len * 8
-            if len(decoded_bits) < total_bits_needed:
-                self.log(f"Warning: Extracted {len(decoded_bits)} bits, needed {total_bits_needed}.")
-                decoded_bits = np.pad(decoded_bits, (0, total_bits_needed - len(decoded_bits)))
-            
-            payload_bits = decoded_bits[:total_bits_needed]
-            payload_bytes = np.packbits(payload_bits).tobytes()
+            if payload_bytes is not None:
+                if len(payload_bytes) < payload_len:
+                    self.log(f"Warning: Extracted {len(payload_bytes) * 8} bits, needed {total_bits_needed}.")
+                    payload_bytes += bytes(payload_len - len(payload_bytes))
+            else:
+                if len(decoded_bits) < total_bits_needed:
+                    self.log(f"Warning: Extracted {len(decoded_bits)} bits, needed {total_bits_needed}.")
+                    decoded_bits = np.pad(decoded_bits, (0, total_bits_needed - len(decoded_bits)))
+                
+                payload_bits = decoded_bits[:total_bits_needed]
+                payload_bytes = np.packbits(payload_bits).tobytes()
             
             # Detect file type from magic bytes (default to .txt for text files)
             ext = ".txt"
             type_name = "Text File"
-            for magic, (extension, name) in self.MAGIC_BYTES.items():
-                if payload_bytes.startswith(magic):
-                    ext = extension
-                    type_name = name
-                    self.log(f"Detected File Type: {name} ({extension})")
-                    break
+            extension, name = self.match_magic_bytes(payload_bytes)
+            if extension:
+                ext = extension
+                type_name = name
+                self.log(f"Detected File Type: {name} ({extension})")
             
             # Show save dialog with detected file type
             filetypes = [(type_name, f"*{ext}"), ("All Files", "*.*")]
@@ -1337,6 +1630,26 @@ class AudioStegoApp:
             traceback.print_exc()
 
     
+    def match_magic_bytes(self, data):
+        """Match data against the known magic prefixes.
+        Returns (extension, description) or (None, None) if no prefix matches.
+        """
+        # A single startswith() call over the prefix tuple rejects unknown data
+        # in C; a match is then found with one slice and dict lookup per
+        # distinct prefix length instead of one comparison per magic.
+        data = bytes(data[:16])
+        if not data.startswith(self._magic_prefixes):
+            return None, None
+        for length, table in self._magic_by_len.items():
+            hit = table.get(data[:length])
+            if hit:
+                return hit
+        return None, None
+
+    # Printable ASCII plus tab, LF and CR: the delete set for bytes.translate()
+    # in detect_file_type()
+    TEXT_PRINTABLE = bytes(b for b in range(256) if 32 <= b < 127 or b in (9, 10, 13))
+
     def detect_file_type(self, data):
         """Detect file type from magic bytes.
         Returns (extension, description) or (None, None) if not detected.
@@ -1344,14 +1657,16 @@ class AudioStegoApp:
         if not data or len(data) < 2:
             return None, None
         
-        for magic, (ext, desc) in self.MAGIC_BYTES.items():
-            if data[:len(magic)] == magic:
-                return ext, desc
+        ext, desc = self.match_magic_bytes(data)
+        if ext:
+            return ext, desc
         
         # Check for text file (printable ASCII)
         try:
-            sample = data[:min(100, len(data))]
-            if all(32 <= b < 127 or b in (9, 10, 13) for b in sample):
+            # translate() deletes the printable bytes in C; nothing left
+            # over means every byte of the sample was printable
+            sample = bytes(data[:100])
+            if not sample.translate(None, self.TEXT_PRINTABLE):
                 return '.txt', 'Text File'
         except Exception:
             pass
@@ -1375,13 +1690,65 @@ class AudioStegoApp:
             start_index: Sample index to start extraction (default: 0)
         
         Returns:
-            np.ndarray: Array of extracted bits (0 or 1)
+            np.ndarray: uint8 array of extracted bits (0 or 1)
+        """
+        # Extract LSB from samples starting at start_index (all samples for 0)
+        region = audio[start_index:]
+        
+        # Mask straight into a uint8 result instead of building an
+        # int16 array of 0/1 first (half the memory traffic)
+        bits = np.empty(len(region), dtype=np.uint8)
+        np.bitwise_and(region, 1, out=bits, casting='unsafe')
+        return bits
+
+    # Multiplier for lsb_extract_bytes(). With only the lane LSBs left in a word
+    # (bits 0, 16, 32, 48 = samples 0-3), multiplying by this moves sample 0's
+    # bit to bit 51, sample 1's to 50, sample 2's to 49 and sample 3's to 48,
+    # with no carries between them, so bits 48-51 are the 4 bits in MSB-first order.
+    LSB_LANE_GATHER = np.uint64(0x0008000400020001)
+
+    def lsb_extract_bytes(self, audio, start_index=0, num_bytes=None):
+        """
+        Read LSB-embedded bytes, same result as packing algo_lsb_decode()'s bits.
+        
+        The inverse of lsb_embed_bytes(): samples are viewed as uint64 words
+        (4 samples each), the lane LSBs are masked out and gathered into one
+        nibble per word with a single multiply, and pairs of nibbles form the
+        bytes. Except for short reads, no array with one element per bit is built.
+        
+        Args:
+            audio: int16 audio sample array to extract from
+            start_index: Sample index to start extraction (default: 0)
+            num_bytes: Number of bytes to read (default: as many as the audio holds)
+        
+        Returns:
+            bytes: The extracted data. Shorter than num_bytes if the audio runs
+                   out, with a trailing partial byte zero-padded like np.packbits().
         """
-        if start_index > 0:
-            # Extract LSB from samples starting at start_index
-            return audio[start_index:] & 1
-        # Extract LSB from all samples
-        return audio & 1
+        available = max(len(audio) - start_index, 0)
+        if num_bytes is None:
+            num_bytes = -(-available // 8)
+        region = audio[start_index:start_index + min(8 * num_bytes, available)]
+        whole = len(region) - len(region) % 8
+        
+        # Short reads such as the 15-byte header are quicker with the plain
+        # per-bit path: the word version costs a few more NumPy calls up front
+        if (len(region) < 2048 or region.dtype != np.int16 or not region.flags.c_contiguous
+                or region.dtype.byteorder == '>' or not np.little_endian):
+            return np.packbits(region & 1).tobytes()
+        
+        lanes = region[:whole].view(np.uint64) & self.LSB_LANE_MASK
+        lanes *= self.LSB_LANE_GATHER
+        lanes >>= np.uint64(48)
+        
+        # Two nibbles per byte: the first word holds the high half
+        nibbles = lanes.astype(np.uint8).reshape(-1, 2)
+        data = nibbles[:, 0]
+        data <<= 4
+        data |= nibbles[:, 1]
+        
+        # Fewer than 8 samples left: pack what is there
+        return data.tobytes() + np.packbits(region[whole:] & 1).tobytes()
 
 
     def algo_echo_decode(self, audio, start_offset=1000, chunk_size=512, d0=100, d1=150):
@@ -1405,6 +1772,14 @@ class AudioStegoApp:
         - The cepstrum detects this periodicity as a peak at position d
         - We compare peaks at d0 vs d1 to determine which echo was added
         
+        FFT length:
+        The chunks are transformed at exactly chunk_size points. The default
+        and the spinbox arrow steps are multiples of 256 (256-8192), whose
+        prime factors are all small, so the FFT runs at full speed without
+        padding. A typed-in size with a large prime factor (e.g. 8191) is
+        slower, but zero-padding it to a "fast" length would change the
+        cepstrum and thus marginal bits, so it is not done.
+        
         Args:
             audio: Audio sample array to decode
             start_offset: Sample index where payload begins (default: 1000)
@@ -1415,39 +1790,46 @@ class AudioStegoApp:
         Returns:
             np.ndarray: Array of decoded bits (0 or 1)
         """
-        audio_length = len(audio)
-        decoded_bits = []
-        current_sample = start_offset
+        # One bit per whole chunk after start_offset
+        num_bits = max(len(audio) - start_offset, 0) // chunk_size
+        if num_bits == 0:
+            return np.zeros(0, dtype=np.uint8)
         
-        # Process each chunk to decode 1 bit
-        while current_sample + chunk_size <= audio_length:
-            chunk = audio[current_sample:current_sample+chunk_size]
-            
-            # =================================================================
-            # Real Cepstrum Calculation (Matlab Port of echo_decoding.m)
-            # =================================================================
-            # Step 1: FFT - Transform chunk to frequency domain
-            spectrum = np.fft.fft(chunk)
-            
-            # Step 2: Log of magnitude (add epsilon to avoid log(0))
-            # The log operation converts multiplication (convolution) to addition
-            # This separates the original signal from the echo
-            log_mag = np.log(np.abs(spectrum) + 1e-8)
-            
-            # Step 3: Inverse FFT of log magnitude
-            # This gives us the cepstrum (quefrency domain)
-            # Peaks in cepstrum correspond to echo delays
-            cepstrum = np.abs(np.fft.ifft(log_mag)).real
-            
-            # Compare cepstrum values at the two possible delay positions
-            val0 = cepstrum[d0]  # Cepstrum value at delay d0
-            val1 = cepstrum[d1]  # Cepstrum value at delay d1
-            
-            # The delay with higher cepstrum value was used for this bit
-            decoded_bits.append(0 if val0 >= val1 else 1)
-            current_sample += chunk_size
-            
-        return np.array(decoded_bits, dtype=np.uint8)
+        # View the payload region as one row per bit and process all chunks at once
+        chunks = self.frame_view(audio, start_offset, chunk_size, num_bits)
+        
+        # =================================================================
+        # Real Cepstrum Calculation (Matlab Port of echo_decoding.m)
+        # =================================================================
+        # Step 1: FFT - Transform each chunk (row) to frequency domain
+        # The chunks are real, so their spectra are conjugate-symmetric and rfft
+        # (positive frequencies only) carries all the information at half the work
+        # Import scipy.fft here to avoid slow startup (lazy import)
+        # Unlike np.fft it can split the rows across all CPU cores (workers=-1)
+        import scipy.fft
+        spectrum = scipy.fft.rfft(chunks, axis=1, workers=-1)
+        
+        # Step 2: Log of magnitude (add epsilon to avoid log(0))
+        # The log operation converts multiplication (convolution) to addition
+        # This separates the original signal from the echo
+        # (computed in place in one array: no temporaries for the + and log)
+        log_mag = np.abs(spectrum)
+        log_mag += 1e-8
+        np.log(log_mag, out=log_mag)
+        
+        # Step 3: Inverse FFT of log magnitude
+        # This gives us the cepstrum (quefrency domain)
+        # Peaks in cepstrum correspond to echo delays
+        # The full log magnitude is real and even, so irfft of its positive half
+        # (n=chunk_size restores the original length) equals the full ifft
+        cepstrum = scipy.fft.irfft(log_mag, n=chunk_size, axis=1, workers=-1, overwrite_x=True)
+        
+        # Compare cepstrum magnitudes at the two possible delay positions
+        # (only these two columns are needed, so abs() is not taken of the rest)
+        # The delay with higher cepstrum value was used for each bit:
+        # cepstrum[d0] >= cepstrum[d1] → bit 0, otherwise bit 1
+        # (a bool array already holds one 0/1 byte per bit: view it, don't copy)
+        return (np.abs(cepstrum[:, d0]) < np.abs(cepstrum[:, d1])).view(np.uint8)
 
     def algo_phase_decode(self, audio, start_offset=1000, segment_size=256, start_bin=20):
         """
@@ -1459,9 +1841,9 @@ class AudioStegoApp:
         whether the phase is positive or negative.
         
         Algorithm:
-        1. For each 256-sample segment, compute FFT
+        1. For each 256-sample segment, compute FFT (all segments in one batch)
         2. Extract phase angle of frequency bins 20-27
-        3. Decode bit based on phase:
+        3. Decode bit based on phase (i.e. the sign of the imaginary part):
            - phase > 0 → bit 1 (was encoded as +90°)
            - phase <= 0 → bit 0 (was encoded as -90°)
         
@@ -1475,28 +1857,55 @@ class AudioStegoApp:
             np.ndarray: Array of decoded bits (0 or 1)
         """
         bits_per_segment = 8  # 8 frequency bins used per segment
-        decoded_bits = []
-        pos = start_offset
         
-        # Process each segment to decode 8 bits
-        while pos + segment_size <= len(audio):
-            # FFT to get frequency domain representation
-            spectrum = np.fft.rfft(audio[pos:pos + segment_size])
-            
-            # Extract phase angles (in radians, range -π to +π)
-            phase = np.angle(spectrum)
-            
-            # Decode 8 bits from frequency bins 20-27
-            for i in range(bits_per_segment):
-                freq_bin = start_bin + i
-                if freq_bin >= len(phase):
-                    break
-                # Positive phase was used for bit 1, negative for bit 0
-                decoded_bits.append(1 if phase[freq_bin] > 0 else 0)
-            
-            pos += segment_size
+        # 8 bits per whole segment after start_offset
+        num_segments = max(len(audio) - start_offset, 0) // segment_size
+        if num_segments == 0:
+            return np.zeros(0, dtype=np.uint8)
         
-        return np.array(decoded_bits, dtype=np.uint8)
+        # View the payload region as one row per segment and transform them all at once
+        segments = self.frame_view(audio, start_offset, segment_size, num_segments)
+        
+        # FFT to get frequency domain representation (axis=1: along each row)
+        # Import scipy.fft here to avoid slow startup (lazy import)
+        # Unlike np.fft it can split the rows across all CPU cores (workers=-1)
+        import scipy.fft
+        spectrum = scipy.fft.rfft(segments, axis=1, workers=-1)
+        
+        # Frequency bins 20-27 (slicing stops at the last bin if the segment has fewer)
+        data_bins = spectrum[:, start_bin:start_bin + bits_per_segment]
+        
+        # Positive phase was used for bit 1, negative for bit 0
+        # Only the sign of the phase matters, and for z = re + i*im the phase
+        # atan2(im, re) has the sign of im, so no atan2 is needed. The two only
+        # disagree on the im == 0 axis (atan2(+0, re < 0) is +π, here bit 0),
+        # where the bin carries no phase information either way
+        # Rows are segments in order, so flattening gives the bits in order
+        return (data_bins.imag > 0).view(np.uint8).ravel()
+
+    def pn_sequence(self, frame_size):
+        """
+        Return the DSSS pseudo-random noise sequence for frame_size.
+        
+        The seed is fixed, so the sequence only depends on frame_size; it is
+        generated once and cached for both the encoder and the decoder.
+        
+        Returns:
+            np.ndarray: Read-only int8 array of -1/+1 values
+        """
+        spread_seq = self._pn_cache.get(frame_size)
+        if spread_seq is None:
+            # Using fixed seed ensures encoder and decoder generate identical sequences
+            rng = np.random.default_rng(seed=12345)
+            
+            # Create bipolar sequence: values are either -1 or +1
+            # rng.integers(0, 2, frame_size) generates 0s and 1s
+            # * 2 - 1 transforms: 0 → -1, 1 → +1
+            # Stored as int8 (a quarter of float32), callers upcast where needed
+            spread_seq = (rng.integers(0, 2, frame_size) * 2 - 1).astype(np.int8)
+            spread_seq.flags.writeable = False
+            self._pn_cache[frame_size] = spread_seq
+        return spread_seq
 
     def algo_spread_spectrum_encode(self, audio, bits, start_offset=1000, frame_size=8192):
         """
@@ -1533,37 +1942,32 @@ class AudioStegoApp:
         
         # Check if we have enough audio for all bits
         if start_offset + len(bits) * frame_size > len(audio):
-            available = len(audio) - start_offset
+            available = max(len(audio) - start_offset, 0)
             bits = bits[:available // frame_size]
             if len(bits) <= 0:
-                return audio
-        
-        # Generate deterministic PN (Pseudo-random Noise) sequence
-        # Using fixed seed ensures encoder and decoder generate identical sequences
-        rng = np.random.default_rng(seed=12345)
+                return audio.copy()
         
-        # Create bipolar sequence: values are either -1 or +1
-        # rng.integers(0, 2, frame_size) generates 0s and 1s
-        # * 2 - 1 transforms: 0 → -1, 1 → +1
-        spread_seq = (rng.integers(0, 2, frame_size) * 2 - 1).astype(np.float32)
-        
-        output = audio.copy().astype(np.float32)
+        # Deterministic PN (Pseudo-random Noise) sequence, shared with the decoder
+        spread_seq = self.pn_sequence(frame_size)
         
         # Embed each bit by adding or subtracting the PN sequence
-        for i, bit in enumerate(bits):
-            start = start_offset + i * frame_size
-            end = start + frame_size
-            if end > len(audio):
-                break
-            
-            if bit == 1:
-                # bit 1: positive correlation with PN sequence
-                output[start:end] += alpha * spread_seq
-            else:
-                # bit 0: negative correlation with PN sequence
-                output[start:end] -= alpha * spread_seq
-        
-        return np.clip(output, -32768, 32767).astype(np.int16)
+        # bit 1: +alpha (positive correlation with PN sequence)
+        # bit 0: -alpha (negative correlation with PN sequence)
+        signs = np.where(np.asarray(bits) == 1, alpha, -alpha).astype(np.float32)
+        
+        # Only the payload region changes, so only it is converted to float32
+        # (a single copy); the rest of the audio is copied as is.
+        # View the region as one row per bit and add sign * PN to every row in
+        # one broadcast operation (column of signs times row of PN)
+        frames = self.frame_view(audio, start_offset, frame_size, len(bits)).astype(np.float32)
+        # (the int8 PN row is cast to float32 once, not once per frame)
+        frames += signs[:, None] * spread_seq.astype(np.float32)[None, :]
+        
+        # Clip to int16 range in place and write back as integer samples
+        np.clip(frames, -32768, 32767, out=frames)
+        output = audio.copy()
+        self.frame_view(output, start_offset, frame_size, len(bits), writeable=True)[:] = frames
+        return output
 
     def algo_spread_spectrum_decode(self, audio, start_offset=1000, frame_size=8192):
         """
@@ -1595,27 +1999,28 @@ class AudioStegoApp:
         Returns:
             np.ndarray: Array of decoded bits (0 or 1)
         """
-        decoded_bits = []
-        
         # Regenerate the exact same PN sequence used by encoder
-        rng = np.random.default_rng(seed=12345)
-        spread_seq = (rng.integers(0, 2, frame_size) * 2 - 1).astype(np.float32)
+        spread_seq = self.pn_sequence(frame_size)
         
-        pos = start_offset
-        while pos + frame_size <= len(audio):
-            # Extract frame for this bit
-            frame = audio[pos:pos + frame_size].astype(np.float32)
-            
-            # Compute correlation: dot product of frame and PN sequence
-            # Divide by frame_size to normalize (optional for comparison)
-            correlation = np.sum(frame * spread_seq) / frame_size
-            
-            # Positive correlation means PN was added (bit 1)
-            # Negative correlation means PN was subtracted (bit 0)
-            decoded_bits.append(1 if correlation >= 0 else 0)
-            pos += frame_size
+        # One bit per whole frame after start_offset
+        num_bits = max(len(audio) - start_offset, 0) // frame_size
+        if num_bits == 0:
+            return np.zeros(0, dtype=np.uint8)
+        
+        # View the payload region as one row per bit
+        # float64 holds every int16 * ±1 partial sum exactly, so the sign test
+        # below is exact even for correlations very close to zero
+        frames = self.frame_view(audio, start_offset, frame_size, num_bits).astype(np.float64)
         
-        return np.array(decoded_bits, dtype=np.uint8)
+        # Compute all correlations at once: row i is the dot product of frame i
+        # and the PN sequence (one matrix-vector product)
+        # Dividing by frame_size would only normalize, the sign is what matters
+        # The int8 PN sequence is only cast to float64 here, for the BLAS call
+        correlation = frames @ spread_seq.astype(np.float64)
+        
+        # Positive correlation means PN was added (bit 1)
+        # Negative correlation means PN was subtracted (bit 0)
+        return (correlation >= 0).view(np.uint8)
 
     # --- Playback/Save ---
     
@@ -1627,76 +2032,225 @@ class AudioStegoApp:
             if self.audio_data is None:
                 return
             data = self.audio_data
-            self.update_plots()
-        else:
-            data = self.process_steganography()
-            
-            # Fallback: If no payload is selected (data is None), generate a dummy preview
-            # This allows the user to see/hear the effect of the algorithm without a file.
-            if data is None:
-                self.generate_preview() # Encodes dummy data and sets self.processed_audio
-                data = self.processed_audio
+            self.mark_dirty('plots')
+            self.start_playback(data)
+            return
+        
+        # Encoding can take seconds on long carriers, so it runs in a worker
+        # thread (NumPy/FFT release the GIL) and the UI stays responsive.
+        # The settings are read here because Tk is main-thread only, and the
+        # carrier and payload are captured so loading new files meanwhile
+        # cannot change what the worker encodes.
+        if self.audio_data is None: return
+        settings = self.snapshot_encoder()
+        carrier = self.audio_data
+        payload_path = self.payload_path
+        self.set_busy(True)
+        
+        def run():
+            data = None
+            try:
+                if payload_path is not None:
+                    data = self.process_steganography(settings, carrier, payload_path)
                 
-            if data is None: return
-            self.processed_audio = data
-            self.update_plots()
+                # Fallback: If no payload is selected (data is None), generate a dummy preview
+                # This allows the user to see/hear the effect of the algorithm without a file.
+                if data is None:
+                    data = self.generate_preview(settings, carrier)
+            except Exception as e:
+                print(f"Encoding error: {e}")
+            finally:
+                # Schedule UI update on the main thread (required for Tkinter)
+                self.root.after(0, self.on_stego_ready, data, carrier)
+        
+        threading.Thread(target=run, daemon=True).start()
 
-        # Convert to float32 for more robust playback compatibility
+    def set_busy(self, busy):
+        """
+        Count a background encode in (busy=True) or out (busy=False).
+        
+        The progress bar is shown while at least one encode (stego preview or
+        save) is running, so overlapping jobs do not hide it early. Both encode
+        buttons stay disabled for that time, so a second save of the same file
+        cannot start while the first one is still writing.
+        """
+        self._busy_jobs += 1 if busy else -1
+        if busy and self._busy_jobs == 1:
+            self.btn_bake.state(['disabled'])
+            self.btn_play_stego.state(['disabled'])
+            self.progress.pack(fill="x", pady=(10, 0))
+            self.progress.start(15)
+        elif not busy and self._busy_jobs == 0:
+            self.progress.stop()
+            self.progress.pack_forget()
+            if self.exiting: return
+            # Preview also works without a payload; re-evaluate both buttons
+            # with the capacity check instead of blindly enabling them
+            self.btn_play_stego.state(['!disabled'])
+            self.mark_dirty('capacity')
+
+    def on_stego_ready(self, data, carrier):
+        """Show and play the stego audio once the worker thread has encoded it."""
+        self.set_busy(False)
+        if self.exiting: return
+        # A carrier loaded during the encode makes the result stale
+        if data is None or self.audio_data is not carrier: return
+        self.processed_audio = data
+        self._display_stego = None
+        self.mark_dirty('plots')
+        self.start_playback(data)
+
+    def get_output_stream(self):
+        """
+        Return the started output stream used for all playback.
+        
+        sd.play() opens and closes a PortAudio stream on every call; this
+        stream is opened once and only reopened when the sample rate changes.
+        """
+        stream = self._out_stream
+        if stream is None or stream.closed or stream.samplerate != self.sample_rate:
+            if stream is not None:
+                stream.close()
+            # int16 like the audio itself, so samples are written without conversion
+            stream = sd.OutputStream(samplerate=self.sample_rate, channels=1, dtype='int16')
+            self._out_stream = stream
+        if not stream.active:
+            stream.start()
+        return stream
+
+    PLAYBACK_BLOCK = 4096 # Samples per stream.write() call
+
+    def start_playback(self, data):
+        """Play an int16 sample array in a background thread."""
+        self.stop_audio()
+        
+        # Let the previous writer return from the aborted stream before reusing it
+        if self.play_thread and self.play_thread.is_alive():
+            self.play_thread.join(timeout=0.5)
+        
         try:
-            data_float = data.astype(np.float32) / 32768.0
+            stream = self.get_output_stream()
         except Exception as e:
-            print(f"Conversion error: {e}")
-            data_float = data
+            print(f"Playback error: {e}")
+            return
 
         self.is_playing = True
         
         def run():
             try:
-                sd.play(data_float, self.sample_rate)
-                sd.wait()
+                # The stream takes int16 directly. write() needs a contiguous
+                # buffer, which only the first channel of a stereo file is
+                # not; anything else is passed through without a copy.
+                samples = np.ascontiguousarray(data, dtype=np.int16)
+                
+                # Write in blocks: each write() blocks in C until its samples
+                # are queued, and between blocks the loop notices stop_audio()
+                # or a newer playback even if abort() did not interrupt write()
+                for pos in range(0, len(samples), self.PLAYBACK_BLOCK):
+                    if not self.is_playing or self.play_thread is not threading.current_thread():
+                        return
+                    stream.write(samples[pos:pos + self.PLAYBACK_BLOCK])
+                
+                # stop() lets the tail play out and leaves the stream ready
+                # for the next play
+                stream.stop()
             except Exception as e:
-                print(f"Playback error: {e}")
+                # stop_audio() aborting the stream mid-write is not an error
+                if self.is_playing:
+                    print(f"Playback error: {e}")
             finally:
-                self.is_playing = False
+                if self.play_thread is threading.current_thread():
+                    self.is_playing = False
 
         self.play_thread = threading.Thread(target=run, daemon=True)
         self.play_thread.start()
 
     def play_decode_audio(self):
-        if self.is_playing: self.stop_audio()
         if self.decode_audio_data is None: return
-        
-        # Convert to float32
+        self.start_playback(self.decode_audio_data)
+
+    def stop_audio(self):
+        self.is_playing = False
+        # abort() drops whatever is queued and makes a pending write() return
         try:
-            data_float = self.decode_audio_data.astype(np.float32) / 32768.0
-        except:
-            data_float = self.decode_audio_data
+            if self._out_stream is not None and self._out_stream.active:
+                self._out_stream.abort()
+        except Exception: pass
 
-        self.is_playing = True
+    def detach_mappings(self, path):
+        """
+        Copy every memory-mapped WAV of 'path' into RAM before it is overwritten.
+        
+        The carrier and the decode-tab audio are memory-mapped, so rewriting
+        their file would change them underneath the app, and a shorter file
+        makes any later read of the mapping crash the process (SIGBUS).
+        """
+        def same(other):
+            return other is not None and os.path.normcase(os.path.abspath(path)) == os.path.normcase(os.path.abspath(other))
+        
+        carrier = same(self.carrier_path) and self.audio_data is not None
+        decode = same(self.decode_audio_path) and self.decode_audio_data is not None
+        if not (carrier or decode): return
+        
+        # A running playback (Play Original or the Decode tab) may still read
+        # the old mapping: stop it first
+        self.stop_audio()
+        if self.play_thread and self.play_thread.is_alive():
+            self.play_thread.join(timeout=0.5)
+        
+        if carrier:
+            self.audio_data = np.array(self.audio_data)
+        if decode:
+            self.decode_audio_data = np.array(self.decode_audio_data)
+
+    def save_stego_file(self):
+        # A running encode may still read a mapping the save would overwrite,
+        # and two saves to the same path would interleave their writes
+        if self._busy_jobs:
+            messagebox.showinfo("Busy", "Please wait for the current encoding to finish.")
+            return
+        
+        if self.audio_data is None or self.payload_path is None:
+            return
+        
+        save_path = filedialog.asksaveasfilename(defaultextension=".wav", filetypes=[("WAV files", "*.wav")])
+        if not save_path or self._busy_jobs:
+            return
+        
+        self.detach_mappings(save_path)
+        
+        # Encoding and writing a long carrier can take seconds, so both run in
+        # a worker thread like the stego preview. The settings are read here
+        # because Tk is main-thread only; the carrier, payload and sample rate
+        # are captured together so loading new files meanwhile cannot mix them.
+        settings = self.snapshot_encoder()
+        carrier = self.audio_data
+        payload_path = self.payload_path
+        sample_rate = self.sample_rate
+        self.set_busy(True)
         
         def run():
+            saved, error = False, None
             try:
-                sd.play(data_float, self.sample_rate)
-                sd.wait()
+                final_audio = self.process_steganography(settings, carrier, payload_path)
+                if final_audio is not None:
+                    wav.write(save_path, sample_rate, final_audio)
+                    saved = True
             except Exception as e:
-                print(f"Playback error: {e}")
+                error = e
             finally:
-                self.is_playing = False
-
-        self.decode_thread = threading.Thread(target=run, daemon=True)
-        self.decode_thread.start()
-
-    def stop_audio(self):
-        try:
-            sd.stop()
-        except: pass
-        self.is_playing = False
-
-    def save_stego_file(self):
-        save_path = filedialog.asksaveasfilename(defaultextension=".wav", filetypes=[("WAV files", "*.wav")])
-        if save_path:
-            final_audio = self.process_steganography()
-            wav.write(save_path, self.sample_rate, final_audio)
+                # Report back on the main thread (required for Tkinter)
+                self.root.after(0, self.on_save_done, save_path, saved, error)
+        
+        threading.Thread(target=run, daemon=True).start()
+
+    def on_save_done(self, save_path, saved, error):
+        """Report the result of save_stego_file() once the worker thread is done."""
+        self.set_busy(False)
+        if self.exiting: return
+        if error is not None:
+            messagebox.showerror("Error", f"Could not save file:\n{error}")
+        elif saved:
             messagebox.showinfo("Success", f"File saved:\n{save_path}")
 
 if __name__ == "__main__":